@@ -18,12 +18,17 @@ from datetime import datetime
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.core.test_framework import StorageTestFramework
-from src.core.config_manager import ConfigManager
-from src.core.device_manager import DeviceManager
-from src.reporting.report_generator import ReportGenerator
+# Heavier framework modules are imported inside the branches that need them so
+# that --help and --list-devices return without loading the whole stack.
 from src.utils.logger import setup_logging
 
+def positive_int(value):
+    """argparse type for integer options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -33,6 +38,7 @@ def parse_arguments():
 Examples:
   %(prog)s --device E: --test performance
   %(prog)s --device F: --test all --iterations 10
+  %(prog)s --device F: --test all --parallel 2
   %(prog)s --list-devices
   %(prog)s --config custom_config.yaml --test endurance
         """
@@ -70,6 +76,15 @@ Examples:
         help='Output directory for reports (overrides config)'
     )
     
+    parser.add_argument(
+        '--parallel', '-p',
+        type=positive_int,
+        metavar='N',
+        help='Number of test categories to run concurrently with --test all; '
+             'performance always runs alone first '
+             '(default: one worker per category, 1 runs sequentially)'
+    )
+    
     parser.add_argument(
         '--list-devices', '-l',
         action='store_true',
@@ -98,6 +113,8 @@ Examples:
 
 def list_devices():
     """List available storage devices."""
+    from src.core.device_manager import DeviceManager
+    
     print("🔍 Scanning for available storage devices...")
     device_manager = DeviceManager()
     devices = device_manager.list_storage_devices()
@@ -108,8 +125,8 @@ def list_devices():
     
     print(f"✅ Found {len(devices)} storage device(s):")
     for i, device in enumerate(devices, 1):
-        print(f"  {i}. {device['path']} - {device['label']} "
-              f"({device['size_gb']:.1f} GB, {device['file_system']})")
+        print(f"  {i}. {device.path} - {device.label} "
+              f"({device.size_gb:.1f} GB, {device.file_system})")
 
 def main():
     """Main function."""
@@ -128,6 +145,10 @@ def main():
         return 0
     
     try:
+        from src.core.config_manager import ConfigManager
+        from src.core.device_manager import DeviceManager
+        from src.core.test_framework import StorageTestFramework
+        
         # Load configuration
         config_manager = ConfigManager(args.config)
         config = config_manager.get_config()
@@ -145,11 +166,11 @@ def main():
         
         device_manager = DeviceManager()
         if not device_manager.validate_device(args.device):
-            logger.error(f"❌ Invalid or inaccessible device: {args.device}")
+            logger.error("❌ Invalid or inaccessible device: %s", args.device)
             return 1
         
         # Initialize test framework
-        framework = StorageTestFramework(config, args.device)
+        framework = StorageTestFramework(config, args.device, parallel=args.parallel)
         
         if args.dry_run:
             logger.info("🧪 Performing dry run...")
@@ -163,7 +184,7 @@ def main():
             pass
         
         # Run tests
-        logger.info(f"🧪 Starting {args.test} test(s) on device: {args.device}")
+        logger.info("🧪 Starting %s test(s) on device: %s", args.test, args.device)
         
         results = None
         if args.test == 'all':
@@ -180,6 +201,7 @@ def main():
         # Generate reports
         if results:
             logger.info("📊 Generating test reports...")
+            from src.reporting.report_generator import ReportGenerator
             report_generator = ReportGenerator(config)
             report_generator.generate_reports(results)
             
@@ -207,7 +229,7 @@ def main():
         logger.warning("⚠️  Testing interrupted by user")
         return 130
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {str(e)}")
+        logger.error("❌ Unexpected error: %s", e)
         if args.verbose:
             import traceback
             traceback.print_exc()
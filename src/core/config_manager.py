@@ -1,13 +1,92 @@
+import copy
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from collections import OrderedDict
+
 import yaml
 
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader; fall back when PyYAML lacks the C extension.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed configs keyed by absolute path -> (mtime_ns, size, config), in LRU order.
+_CACHE = OrderedDict()
+_CACHE_MAXSIZE = 100
+
 class ConfigManager:
     def __init__(self, config_path):
         self.config_path = config_path
         self.config = self._load_config()
 
     def _load_config(self):
-        with open(self.config_path, 'r') as file:
-            return yaml.safe_load(file)
+        key = os.path.abspath(self.config_path)
+        st = os.stat(key)
+        cached = _CACHE.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _CACHE.move_to_end(key)
+            # Hand out a copy so callers overriding values don't corrupt the cache
+            return copy.deepcopy(cached[2])
+
+        with open(key, 'rb') as file:
+            data = file.read()
+        config = self._load_sidecar(key, data)
+
+        _CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+        _CACHE.move_to_end(key)
+        if len(_CACHE) > _CACHE_MAXSIZE:
+            _CACHE.popitem(last=False)
+        return copy.deepcopy(config)
+
+    def _load_sidecar(self, path, data):
+        """
+        Return the parsed config, reusing a JSON sidecar keyed by content hash.
+        
+        The sidecar lives next to the YAML as `<config>.<hash>.json`; a missing or
+        corrupt one is rebuilt from the YAML and stale siblings are removed.
+        JSON keeps the cache as plain data, so it can't carry code.
+        """
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        sidecar = f"{path}.{digest}.json"
+        try:
+            with open(sidecar, 'rb') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable config cache %s: %s", sidecar, e)
+
+        config = yaml.load(data, Loader=_YAML_LOADER)
+        try:
+            text = json.dumps(config)
+        except (TypeError, ValueError):
+            return config
+        # Skip configs JSON can't represent exactly (dates, non-string keys, ...)
+        if json.loads(text) != config:
+            return config
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                file.write(text)
+            os.replace(tmp_path, sidecar)
+            # Only remove names we generate; leave e.g. config.yaml.schema.json alone
+            prefix, suffix = f"{path}.", ".json"
+            for stale in glob.glob(f"{glob.escape(path)}.*.json"):
+                digest_part = stale[len(prefix):-len(suffix)]
+                if stale != sidecar and re.fullmatch(r'[0-9a-f]{32}', digest_part):
+                    os.remove(stale)
+        except OSError:
+            # The cache is an optimisation only; read-only config dirs are fine
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return config
 
     def get_config(self):
         return self.config
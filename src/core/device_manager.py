@@ -6,38 +6,194 @@ for storage devices on different operating systems.
 """
 
 import os
+import errno
 import platform
+import shutil
+import stat
 import psutil
 import logging
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Host OS is fixed for the life of the process; resolve it once at import.
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# How long a partition scan is reused before psutil is queried again (seconds)
+_PARTITION_CACHE_TTL = 1.0
+
+# File systems treated as candidate test targets on Windows
+_WIN_FS = frozenset({'FAT32', 'NTFS', 'exFAT'})
+
+# FAT-family file systems, where metadata updates are slow on flash media
+_FAT_FS = frozenset({'FAT', 'FAT32', 'VFAT', 'EXFAT', 'MSDOS'})
+
+# Bytes -> GiB scale factor
+_GB = 1 / (1024**3)
+
+@dataclass(frozen=True)
+class DeviceInfo:
+    """Information about a storage device; sizes are stored in bytes only."""
+    
+    __slots__ = ('path', 'device', 'file_system', 'label',
+                 'size_bytes', 'free_bytes', 'used_bytes', 'is_removable')
+    
+    path: str
+    device: str
+    file_system: str
+    label: str
+    size_bytes: int
+    free_bytes: int
+    used_bytes: int
+    is_removable: bool
+    
+    # Frozen instances can't be restored through setattr, which copy and
+    # pickle rely on for slotted classes; go through object.__setattr__
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
+    @property
+    def size_gb(self):
+        return self.size_bytes * _GB
+    
+    @property
+    def free_gb(self):
+        return self.free_bytes * _GB
+    
+    @property
+    def used_gb(self):
+        return self.used_bytes * _GB
+    
+    @property
+    def usage_percent(self):
+        return (self.used_bytes / self.size_bytes) * 100 if self.size_bytes > 0 else 0
+
+def device_table(devices):
+    """
+    Build a column-oriented view of many devices for fleet-wide aggregation.
+    
+    Args:
+        devices (list): DeviceInfo records
+        
+    Returns:
+        numpy.recarray: One record per device, one array per field
+    """
+    import numpy as np
+    
+    return np.rec.fromrecords(
+        [(d.path, d.device, d.file_system, d.label,
+          d.size_bytes, d.free_bytes, d.used_bytes, d.is_removable) for d in devices],
+        dtype=[('path', object), ('device', object), ('file_system', object),
+               ('label', object), ('size_bytes', np.int64), ('free_bytes', np.int64),
+               ('used_bytes', np.int64), ('is_removable', np.bool_)]
+    )
+
+def _mount_point(device_path):
+    """Normalise a bare drive such as 'E:' to the 'E:\\' form psutil reports."""
+    drive, rest = os.path.splitdrive(device_path)
+    if drive and not rest:
+        return drive + os.sep
+    return device_path
+
+# Volume labels keyed by drive path -> (lookup time, label). Entries expire with
+# the partition scan so a different stick under the same letter is picked up.
+_LABEL_CACHE = {}
+
+def _query_volume_label(drive_path):
+    """Look up a Windows volume label, preferring the Win32 API over `vol`."""
+    now = time.monotonic()
+    cached = _LABEL_CACHE.get(drive_path)
+    if cached is not None and now - cached[0] <= _PARTITION_CACHE_TTL:
+        return cached[1]
+    try:
+        label = _win32_volume_label(drive_path)
+    except OSError:
+        label = _vol_command_label(drive_path)
+    _LABEL_CACHE[drive_path] = (now, label)
+    return label
+
+def _win32_volume_label(drive_path):
+    """Read the volume label via kernel32.GetVolumeInformationW."""
+    import ctypes
+    
+    root = drive_path if drive_path.endswith('\\') else drive_path + '\\'
+    label = ctypes.create_unicode_buffer(256)
+    if not ctypes.windll.kernel32.GetVolumeInformationW(
+        root, label, len(label), None, None, None, None, 0
+    ):
+        raise ctypes.WinError()
+    return label.value or "Unknown"
+
+def _vol_command_label(drive_path):
+    """Read the volume label by parsing the output of the `vol` command."""
+    import subprocess
+    result = subprocess.run(
+        ['vol', drive_path],
+        capture_output=True,
+        text=True,
+        shell=True
+    )
+    if result.returncode == 0:
+        lines = result.stdout.strip().split('\n')
+        for line in lines:
+            if 'Volume in drive' in line and 'is' in line:
+                return line.split('is')[-1].strip()
+    return "Unknown"
+
 class DeviceManager:
     """Manages storage device operations and validation."""
     
     def __init__(self):
-        self.system = platform.system()
+        self.system = _SYSTEM
+        self._partitions = None
+        self._partitions_time = 0.0
+        # Paths that have already passed the write check; strict passes are
+        # tracked separately so an earlier fast-path pass can't satisfy strict
+        self._validated = set()
+        self._strict_validated = set()
         
+    def _partitions_by_mount(self):
+        """
+        Map mount points to psutil partition entries.
+        
+        The scan is reused for a short TTL so that frequent polling does not
+        re-enumerate every partition on each call.
+        
+        Returns:
+            dict: Mapping of mount point to partition
+        """
+        now = time.monotonic()
+        if self._partitions is None or now - self._partitions_time > _PARTITION_CACHE_TTL:
+            self._partitions = {p.mountpoint: p for p in psutil.disk_partitions(all=False)}
+            self._partitions_time = now
+        return self._partitions
+    
     def list_storage_devices(self):
         """
         List all available removable storage devices.
         
         Returns:
-            list: List of device dictionaries with device information
+            list: List of DeviceInfo records
         """
         devices = []
         
         try:
-            if self.system == "Windows":
+            if _IS_WINDOWS:
                 devices = self._list_windows_devices()
             elif self.system in ["Linux", "Darwin"]:
                 devices = self._list_unix_devices()
             else:
-                logger.warning(f"Unsupported operating system: {self.system}")
+                logger.warning("Unsupported operating system: %s", self.system)
                 
         except Exception as e:
-            logger.error(f"Error listing storage devices: {str(e)}")
+            logger.error("Error listing storage devices: %s", e)
             
         return devices
     
@@ -45,28 +201,26 @@ class DeviceManager:
         """List removable storage devices on Windows."""
         devices = []
         
-        for partition in psutil.disk_partitions():
-            if 'removable' in partition.opts or partition.fstype in ['FAT32', 'NTFS', 'exFAT']:
+        for partition in self._partitions_by_mount().values():
+            is_removable = self._is_removable(partition)
+            if is_removable or partition.fstype in _WIN_FS:
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    device_info = {
-                        'path': partition.mountpoint,
-                        'device': partition.device,
-                        'file_system': partition.fstype,
-                        'label': self._get_volume_label(partition.mountpoint),
-                        'size_bytes': usage.total,
-                        'size_gb': usage.total / (1024**3),
-                        'free_bytes': usage.free,
-                        'free_gb': usage.free / (1024**3),
-                        'used_bytes': usage.used,
-                        'used_gb': usage.used / (1024**3),
-                        'is_removable': 'removable' in partition.opts
-                    }
+                    usage = shutil.disk_usage(partition.mountpoint)
+                    device_info = DeviceInfo(
+                        path=partition.mountpoint,
+                        device=partition.device,
+                        file_system=partition.fstype,
+                        label=self._get_volume_label(partition.mountpoint),
+                        size_bytes=usage.total,
+                        free_bytes=usage.free,
+                        used_bytes=usage.used,
+                        is_removable=is_removable
+                    )
                     devices.append(device_info)
                 except PermissionError:
-                    logger.warning(f"Permission denied accessing {partition.mountpoint}")
+                    logger.warning("Permission denied accessing %s", partition.mountpoint)
                 except Exception as e:
-                    logger.warning(f"Error accessing {partition.mountpoint}: {str(e)}")
+                    logger.warning("Error accessing %s: %s", partition.mountpoint, e)
                     
         return devices
     
@@ -74,92 +228,120 @@ class DeviceManager:
         """List removable storage devices on Unix-like systems."""
         devices = []
         
-        for partition in psutil.disk_partitions():
+        for partition in self._partitions_by_mount().values():
             # Check if it's a removable device (USB, external drive, etc.)
-            if (partition.device.startswith('/dev/sd') or 
-                partition.device.startswith('/dev/disk') or
-                '/media/' in partition.mountpoint or
-                '/mnt/' in partition.mountpoint):
-                
+            if self._is_removable(partition):
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    device_info = {
-                        'path': partition.mountpoint,
-                        'device': partition.device,
-                        'file_system': partition.fstype,
-                        'label': os.path.basename(partition.mountpoint),
-                        'size_bytes': usage.total,
-                        'size_gb': usage.total / (1024**3),
-                        'free_bytes': usage.free,
-                        'free_gb': usage.free / (1024**3),
-                        'used_bytes': usage.used,
-                        'used_gb': usage.used / (1024**3),
-                        'is_removable': True
-                    }
+                    usage = shutil.disk_usage(partition.mountpoint)
+                    device_info = DeviceInfo(
+                        path=partition.mountpoint,
+                        device=partition.device,
+                        file_system=partition.fstype,
+                        label=os.path.basename(partition.mountpoint),
+                        size_bytes=usage.total,
+                        free_bytes=usage.free,
+                        used_bytes=usage.used,
+                        is_removable=True
+                    )
                     devices.append(device_info)
                 except PermissionError:
-                    logger.warning(f"Permission denied accessing {partition.mountpoint}")
+                    logger.warning("Permission denied accessing %s", partition.mountpoint)
                 except Exception as e:
-                    logger.warning(f"Error accessing {partition.mountpoint}: {str(e)}")
+                    logger.warning("Error accessing %s: %s", partition.mountpoint, e)
                     
         return devices
     
+    def _is_removable(self, partition):
+        """Check whether a psutil partition looks like a removable device."""
+        if _IS_WINDOWS:
+            return 'removable' in partition.opts.split(',')
+        return (partition.device.startswith(('/dev/sd', '/dev/disk')) or
+                '/media/' in partition.mountpoint or
+                '/mnt/' in partition.mountpoint)
+    
     def _get_volume_label(self, drive_path):
         """Get volume label for Windows drives."""
         try:
-            import subprocess
-            result = subprocess.run(
-                ['vol', drive_path],
-                capture_output=True,
-                text=True,
-                shell=True
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if 'Volume in drive' in line and 'is' in line:
-                        return line.split('is')[-1].strip()
-            return "Unknown"
+            return _query_volume_label(drive_path)
         except Exception:
             return "Unknown"
     
-    def validate_device(self, device_path):
+    def validate_device(self, device_path, strict=False):
         """
         Validate that a device path is accessible and writable.
         
+        The write check is specialised per file system unless `strict` is set:
+        FAT/exFAT volumes are checked with os.access only, and NTFS on Windows
+        uses a delete-on-close temporary file that is never flushed.
+        
         Args:
             device_path (str): Path to the device to validate
+            strict (bool): Always create, write and remove a probe file
             
         Returns:
             bool: True if device is valid and accessible, False otherwise
         """
         try:
-            # Check if path exists
-            if not os.path.exists(device_path):
-                logger.error(f"Device path does not exist: {device_path}")
+            # Check existence and type with a single stat
+            try:
+                st = os.stat(device_path)
+            except FileNotFoundError:
+                logger.error("Device path does not exist: %s", device_path)
                 return False
             
             # Check if it's a directory (mount point)
-            if not os.path.isdir(device_path):
-                logger.error(f"Device path is not a directory: {device_path}")
+            if not stat.S_ISDIR(st.st_mode):
+                logger.error("Device path is not a directory: %s", device_path)
                 return False
             
+            # The write probe costs several metadata updates on flash media;
+            # once a path has passed it, trust it for this manager's lifetime
+            validated = self._strict_validated if strict else self._validated
+            if device_path in validated:
+                return True
+            
             # Check if we have write permissions
-            test_file = os.path.join(device_path, '.storage_test_write_check')
             try:
-                with open(test_file, 'w') as f:
-                    f.write('test')
-                os.remove(test_file)
-                logger.info(f"Device validation successful: {device_path}")
+                self._probe_write(device_path, strict)
+                validated.add(device_path)
+                if strict:
+                    # A full probe also vouches for the non-strict checks
+                    self._validated.add(device_path)
+                logger.info("Device validation successful: %s", device_path)
                 return True
             except (PermissionError, OSError) as e:
-                logger.error(f"Cannot write to device {device_path}: {str(e)}")
+                logger.error("Cannot write to device %s: %s", device_path, e)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error validating device {device_path}: {str(e)}")
+            logger.error("Error validating device %s: %s", device_path, e)
             return False
     
+    def _probe_write(self, device_path, strict):
+        """Raise OSError if device_path cannot be written to."""
+        test_file = os.path.join(device_path, '.storage_test_write_check')
+        
+        if not strict:
+            partition = self._partitions_by_mount().get(_mount_point(device_path))
+            fstype = partition.fstype.upper() if partition else ''
+            
+            if fstype in _FAT_FS:
+                if not os.access(device_path, os.W_OK):
+                    raise PermissionError(errno.EACCES, "Write access denied", device_path)
+                return
+            
+            if _IS_WINDOWS and fstype == 'NTFS':
+                # FILE_FLAG_DELETE_ON_CLOSE | FILE_ATTRIBUTE_TEMPORARY; no O_EXCL so
+                # a probe left behind by a crashed run is reused, not an error
+                flags = (os.O_CREAT | os.O_TRUNC | os.O_WRONLY |
+                         os.O_TEMPORARY | os.O_SHORT_LIVED)
+                os.close(os.open(test_file, flags))
+                return
+        
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.remove(test_file)
+    
     def get_device_info(self, device_path):
         """
         Get detailed information about a specific device.
@@ -168,36 +350,29 @@ class DeviceManager:
             device_path (str): Path to the device
             
         Returns:
-            dict: Device information dictionary
+            DeviceInfo: Device information, or None if error
         """
         try:
-            usage = psutil.disk_usage(device_path)
+            usage = shutil.disk_usage(device_path)
             
             # Find matching partition info
-            partition_info = None
-            for partition in psutil.disk_partitions():
-                if partition.mountpoint == device_path:
-                    partition_info = partition
-                    break
+            partition_info = self._partitions_by_mount().get(_mount_point(device_path))
             
-            device_info = {
-                'path': device_path,
-                'device': partition_info.device if partition_info else 'Unknown',
-                'file_system': partition_info.fstype if partition_info else 'Unknown',
-                'label': self._get_volume_label(device_path) if self.system == "Windows" else os.path.basename(device_path),
-                'size_bytes': usage.total,
-                'size_gb': usage.total / (1024**3),
-                'free_bytes': usage.free,
-                'free_gb': usage.free / (1024**3),
-                'used_bytes': usage.used,
-                'used_gb': usage.used / (1024**3),
-                'usage_percent': (usage.used / usage.total) * 100 if usage.total > 0 else 0
-            }
+            device_info = DeviceInfo(
+                path=device_path,
+                device=partition_info.device if partition_info else 'Unknown',
+                file_system=partition_info.fstype if partition_info else 'Unknown',
+                label=self._get_volume_label(device_path) if _IS_WINDOWS else os.path.basename(device_path),
+                size_bytes=usage.total,
+                free_bytes=usage.free,
+                used_bytes=usage.used,
+                is_removable=self._is_removable(partition_info) if partition_info else False
+            )
             
             return device_info
             
         except Exception as e:
-            logger.error(f"Error getting device info for {device_path}: {str(e)}")
+            logger.error("Error getting device info for %s: %s", device_path, e)
             return None
     
     def get_available_space(self, device_path):
@@ -211,10 +386,10 @@ class DeviceManager:
             int: Available space in bytes, or None if error
         """
         try:
-            usage = psutil.disk_usage(device_path)
+            usage = shutil.disk_usage(device_path)
             return usage.free
         except Exception as e:
-            logger.error(f"Error getting available space for {device_path}: {str(e)}")
+            logger.error("Error getting available space for %s: %s", device_path, e)
             return None
     
     def is_device_mounted(self, device_path):
@@ -228,6 +403,13 @@ class DeviceManager:
             bool: True if device is mounted, False otherwise
         """
         try:
-            return os.path.exists(device_path) and os.path.ismount(device_path)
+            # lstat, like os.path.ismount: a symlink is never a mount point
+            st = os.lstat(device_path)
+            if stat.S_ISLNK(st.st_mode):
+                return False
+            parent = os.lstat(os.path.join(device_path, os.pardir))
+            # A mount point sits on a different device than its parent; the
+            # filesystem root is its own parent
+            return st.st_dev != parent.st_dev or st.st_ino == parent.st_ino
         except Exception:
             return False
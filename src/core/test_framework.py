@@ -1,9 +1,133 @@
+import io
 import logging
+import mmap
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from src.utils.logger import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Performance workload matrix: (block_size, queue_depth, access pattern, operation)
+PERFORMANCE_WORKLOADS = (
+    (64 * 1024, 4, 'seq', 'r'),
+    (64 * 1024, 4, 'seq', 'w'),
+    (8 * 1024, 1, 'rand', 'r'),
+    (8 * 1024, 4, 'rand', 'r'),
+    (8 * 1024, 1, 'rand', 'w'),
+    (8 * 1024, 4, 'rand', 'w'),
+)
+
+# Bypass the page cache where the platform supports it so reads hit the device
+_DIRECT_FLAGS = getattr(os, 'O_DIRECT', 0)
+_OPEN_FLAGS = os.O_RDWR | getattr(os, 'O_BINARY', 0)
+
+try:
+    import fcntl
+    _F_NOCACHE = getattr(fcntl, 'F_NOCACHE', None)
+except ImportError:
+    _F_NOCACHE = None
+
+if hasattr(os, 'preadv'):
+    def _read_at(f, buf, offset):
+        return os.preadv(f.fileno(), [buf], offset)
+
+    def _write_at(f, buf, offset):
+        return os.pwritev(f.fileno(), [buf], offset)
+else:
+    # No positional I/O (Windows); each queue slot owns its file, so seeking is
+    # safe. readinto fills the aligned buffer in place, where os.read would
+    # allocate an unaligned one that unbuffered handles reject.
+    def _read_at(f, buf, offset):
+        f.seek(offset)
+        return f.readinto(buf)
+
+    def _write_at(f, buf, offset):
+        f.seek(offset)
+        return f.write(buf)
+
+def _open_no_buffering(path):
+    """Open path on Windows with FILE_FLAG_NO_BUFFERING and return a CRT fd."""
+    import ctypes
+    import msvcrt
+    from ctypes import wintypes
+
+    GENERIC_READ, GENERIC_WRITE = 0x80000000, 0x40000000
+    FILE_SHARE_READ, FILE_SHARE_WRITE = 0x1, 0x2
+    OPEN_EXISTING = 3
+    FILE_FLAG_NO_BUFFERING, FILE_FLAG_WRITE_THROUGH = 0x20000000, 0x80000000
+
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    create_file = kernel32.CreateFileW
+    create_file.restype = wintypes.HANDLE
+    create_file.argtypes = (wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD,
+                            wintypes.LPVOID, wintypes.DWORD, wintypes.DWORD,
+                            wintypes.HANDLE)
+    handle = create_file(path, GENERIC_READ | GENERIC_WRITE,
+                         FILE_SHARE_READ | FILE_SHARE_WRITE, None, OPEN_EXISTING,
+                         FILE_FLAG_NO_BUFFERING | FILE_FLAG_WRITE_THROUGH, None)
+    if handle in (None, wintypes.HANDLE(-1).value):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return msvcrt.open_osfhandle(handle, 0)
+
+def _open_unbuffered(path):
+    """
+    Open path bypassing the OS cache where possible.
+
+    Returns:
+        tuple: (fd, direct) where direct is False if I/O goes through the cache
+    """
+    if os.name == 'nt':
+        try:
+            return _open_no_buffering(path), True
+        except OSError as e:
+            logger.debug("FILE_FLAG_NO_BUFFERING unavailable for %s: %s", path, e)
+    elif _DIRECT_FLAGS:
+        try:
+            return os.open(path, _OPEN_FLAGS | _DIRECT_FLAGS), True
+        except OSError as e:
+            # e.g. tmpfs and some FUSE filesystems reject O_DIRECT
+            logger.debug("O_DIRECT unavailable for %s: %s", path, e)
+
+    fd = os.open(path, _OPEN_FLAGS)
+    if _F_NOCACHE is not None:
+        # macOS: disable caching on the open file instead of at open time
+        try:
+            fcntl.fcntl(fd, _F_NOCACHE, 1)
+            return fd, True
+        except OSError as e:
+            logger.debug("F_NOCACHE unavailable for %s: %s", path, e)
+    return fd, False
+
+def _io_worker(path, block_size, offsets, op):
+    """
+    Issue one queue slot's share of a workload.
+
+    Returns:
+        tuple: (bytes transferred, whether the OS cache was bypassed)
+    """
+    # mmap buffers are page aligned, as unbuffered I/O requires
+    buf = mmap.mmap(-1, block_size)
+    if op == 'w':
+        buf.write(os.urandom(block_size))
+    transfer = _write_at if op == 'w' else _read_at
+    fd, direct = _open_unbuffered(path)
+    try:
+        with io.FileIO(fd, 'r+') as f:
+            done = 0
+            for offset in offsets:
+                done += transfer(f, buf, offset)
+            if op == 'w':
+                os.fsync(f.fileno())
+        return done, direct
+    finally:
+        buf.close()
+
 class StorageTestFramework:
-    def __init__(self, config, device_path):
+    def __init__(self, config, device_path, parallel=None):
         self.config = config
         self.device_path = device_path
         self.tests = {
@@ -12,19 +136,40 @@ class StorageTestFramework:
             'endurance': self.run_endurance_tests,
             'fault': self.run_fault_tests
         }
+        # Worker processes for the pooled categories in run_all_tests; defaults
+        # to one per test category
+        if parallel is not None and parallel < 1:
+            raise ValueError(f"parallel must be at least 1, got {parallel}")
+        self.parallel = len(self.tests) if parallel is None else parallel
 
     def run_all_tests(self):
         logger.info("Running all tests...")
-        results = {}
-        results['performance'] = self.run_performance_tests()
-        results['integrity'] = self.run_integrity_tests()
-        results['endurance'] = self.run_endurance_tests()
-        results['fault'] = self.run_fault_tests()
+        # Performance runs alone, before anything else touches the device, so
+        # its MB/s figures aren't diluted by other categories competing for
+        # the same bandwidth; only the remaining categories share the pool
+        completed = {'performance': self.run_performance_tests()}
+        pooled = {name: test for name, test in self.tests.items() if name != 'performance'}
+
+        workers = min(self.parallel, len(pooled))
+        if workers > 1:
+            # Spawned workers (Windows, macOS) start without logging handlers
+            with ProcessPoolExecutor(max_workers=workers, initializer=setup_logging,
+                                     initargs=(logging.getLogger().level,)) as executor:
+                futures = {executor.submit(test): name for name, test in pooled.items()}
+                for future in as_completed(futures):
+                    completed[futures[future]] = future.result()
+        else:
+            for name, test in pooled.items():
+                completed[name] = test()
+        # Keep report ordering stable regardless of completion order
+        results = {name: completed[name] for name in self.tests}
         
-        # Calculate overall summary
-        total_tests = sum(r['total_tests'] for r in results.values())
-        total_passed = sum(r['passed'] for r in results.values())
-        total_failed = sum(r['failed'] for r in results.values())
+        # Calculate overall summary in a single pass
+        total_tests = total_passed = total_failed = 0
+        for r in results.values():
+            total_tests += r['total_tests']
+            total_passed += r['passed']
+            total_failed += r['failed']
         
         results['total_tests'] = total_tests
         results['passed'] = total_passed
@@ -33,16 +178,116 @@ class StorageTestFramework:
         
         return results
 
+    def _scratch_dir(self, test_name):
+        """
+        Per-category working directory so parallel workers never share files.
+        
+        Returns a TemporaryDirectory; use it as a context manager so the
+        directory and everything in it is removed from the device afterwards.
+        """
+        return tempfile.TemporaryDirectory(prefix=f'.storage_test_{test_name}_',
+                                           dir=self.device_path)
+
     def run_performance_tests(self):
         logger.info("Running performance tests...")
-        # Simulate performance test logic
+        perf_config = self.config.get('performance', {})
+        test_file_mb = perf_config.get('test_file_mb', 64)
+        try:
+            file_size = int(test_file_mb) * 1024 * 1024
+        except (TypeError, ValueError):
+            file_size = 0
+        # Sequential and random I/O differ by an order of magnitude on flash,
+        # so each access pattern has its own floor
+        min_speed = {
+            ('seq', 'r'): perf_config.get('min_read_speed', 0),
+            ('seq', 'w'): perf_config.get('min_write_speed', 0),
+            ('rand', 'r'): perf_config.get('min_random_read_speed', 0),
+            ('rand', 'w'): perf_config.get('min_random_write_speed', 0)
+        }
+
+        workloads = []
+        largest_block = max(block_size for block_size, *_ in PERFORMANCE_WORKLOADS)
+        if file_size < 1024 * 1024 or file_size % largest_block:
+            logger.error("Invalid performance.test_file_mb %r: must be a whole number "
+                         "of MB, at least 1 and a multiple of %d bytes",
+                         test_file_mb, largest_block)
+            return self._performance_summary(workloads)
+
+        try:
+            with self._scratch_dir('performance') as scratch:
+                test_file = os.path.join(scratch, 'workload.dat')
+                self._prepare_test_file(test_file, file_size)
+                for block_size, queue_depth, pattern, op in PERFORMANCE_WORKLOADS:
+                    name = f"{pattern}_{op}_{block_size // 1024}k_qd{queue_depth}"
+                    try:
+                        speed, direct = self._run_workload(test_file, file_size, block_size,
+                                                           queue_depth, pattern, op)
+                        if direct:
+                            passed = speed >= min_speed[pattern, op]
+                            logger.info("%s: %.1f MB/s", name, speed)
+                        else:
+                            # Cached throughput says nothing about the device
+                            passed = False
+                            logger.warning("%s: %.1f MB/s measured through the OS cache, "
+                                           "not counted as a pass", name, speed)
+                    except OSError as e:
+                        logger.error("Performance workload %s failed: %s", name, e)
+                        speed, passed, direct = 0.0, False, False
+                    workloads.append({'name': name, 'mb_per_s': speed,
+                                      'cached': not direct, 'passed': passed})
+        except OSError as e:
+            logger.error("Cannot prepare performance test file on %s: %s", self.device_path, e)
+
+        return self._performance_summary(workloads)
+
+    def _performance_summary(self, workloads):
+        """Summarise workload results; missing workloads count as failures."""
+        total_tests = len(PERFORMANCE_WORKLOADS)
+        passed = sum(1 for w in workloads if w['passed'])
         return {
-            'total_tests': 10,
-            'passed': 9,
-            'failed': 1,
-            'success_rate': 90.0
+            'total_tests': total_tests,
+            'passed': passed,
+            'failed': total_tests - passed,
+            'success_rate': passed / total_tests * 100,
+            'workloads': workloads
         }
 
+    def _prepare_test_file(self, path, size):
+        """Fill the workload file so reads hit allocated blocks on the device."""
+        chunk = os.urandom(1024 * 1024)
+        with open(path, 'wb') as f:
+            for _ in range(size // len(chunk)):
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _run_workload(self, path, file_size, block_size, queue_depth, pattern, op):
+        """
+        Run one workload from the matrix over the whole test file.
+
+        Queue depth is emulated with one thread per outstanding request; the
+        blocking pread/pwrite calls release the GIL, so requests overlap.
+
+        Returns:
+            tuple: (throughput in MB/s, whether the OS cache was bypassed)
+        """
+        offsets = list(range(0, file_size, block_size))
+        if pattern == 'rand':
+            random.shuffle(offsets)
+        # Interleave so sequential slots walk the file side by side
+        shares = [offsets[i::queue_depth] for i in range(queue_depth)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=queue_depth) as executor:
+            slots = list(executor.map(
+                lambda share: _io_worker(path, block_size, share, op), shares
+            ))
+        elapsed = time.perf_counter() - start
+        transferred = sum(done for done, _ in slots)
+        direct = all(direct for _, direct in slots)
+        speed = transferred / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+        return speed, direct
+
     def run_integrity_tests(self):
         logger.info("Running data integrity tests...")
         # Simulate data integrity test logic
@@ -1,15 +1,76 @@
+import csv
+import io
 import logging
 import os
-from plotly.subplots import make_subplots
-import plotly.graph_objects as go
+from jinja2 import Environment
 
 logger = logging.getLogger(__name__)
 
+# Overall-summary keys in a results dict; everything else is a per-test section
+_SUMMARY_FIELDS = frozenset({'total_tests', 'passed', 'failed', 'success_rate'})
+
+HTML_TEMPLATE = """\
+<html><head><title>Test Report</title></head><body>
+<h1>USB/SSD Test Report</h1>
+{% for test_type, result in results.items() %}
+{% if test_type not in summary_fields and result is mapping %}
+<h2>{{ test_type | capitalize }} Tests</h2>
+<p>Total Tests: {{ result['total_tests'] }}</p>
+<p>Passed: {{ result['passed'] }}</p>
+<p>Failed: {{ result['failed'] }}</p>
+<p>Success Rate: {{ result['success_rate'] }}%</p>
+{% endif %}
+{% endfor %}
+{% if 'total_tests' in results %}
+<h2>Overall Summary</h2>
+<p>Total Tests: {{ results['total_tests'] }}</p>
+<p>Passed: {{ results['passed'] }}</p>
+<p>Failed: {{ results['failed'] }}</p>
+<p>Success Rate: {{ '%.1f' | format(results['success_rate']) }}%</p>
+{% endif %}
+</body></html>
+"""
+
+# Compiled once at import; rendering reuses the generated code
+_HTML_TEMPLATE = Environment(
+    autoescape=True, trim_blocks=True, lstrip_blocks=True
+).from_string(HTML_TEMPLATE)
+
+_WRITE_FLAGS = os.O_CREAT | os.O_WRONLY | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def _write_report(path, text):
+    """Write a fully rendered report with raw os-level writes."""
+    view = memoryview(text.encode('utf-8'))
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 class ReportGenerator:
+    # Output directories already created in this process
+    _dirs_made = set()
+
     def __init__(self, config):
         self.config = config
         self.output_dir = config['reporting']['output_dir']
-        os.makedirs(self.output_dir, exist_ok=True)
+        if self.output_dir not in ReportGenerator._dirs_made:
+            os.makedirs(self.output_dir, exist_ok=True)
+            ReportGenerator._dirs_made.add(self.output_dir)
+
+    def _write(self, report_path, text):
+        """Write a report, recreating the output directory if it has vanished."""
+        try:
+            _write_report(report_path, text)
+        except FileNotFoundError:
+            # _dirs_made is never re-checked, so the directory may have been
+            # removed since it was created; rebuild it and retry once
+            ReportGenerator._dirs_made.discard(self.output_dir)
+            logger.warning("Output directory %s is missing, recreating it", self.output_dir)
+            os.makedirs(self.output_dir, exist_ok=True)
+            ReportGenerator._dirs_made.add(self.output_dir)
+            _write_report(report_path, text)
 
     def generate_reports(self, results):
         self._generate_html_report(results)
@@ -18,48 +79,28 @@ class ReportGenerator:
     def _generate_html_report(self, results):
         logger.info("Generating HTML report...")
         report_path = os.path.join(self.output_dir, 'report.html')
-        with open(report_path, 'w') as file:
-            file.write("<html><head><title>Test Report</title></head><body>")
-            file.write("<h1>USB/SSD Test Report</h1>")
-            
-            # Skip summary fields for individual test sections
-            summary_fields = {'total_tests', 'passed', 'failed', 'success_rate'}
-            
-            for test_type, result in results.items():
-                if test_type not in summary_fields and isinstance(result, dict):
-                    file.write(f"<h2>{test_type.capitalize()} Tests</h2>")
-                    file.write(f"<p>Total Tests: {result['total_tests']}</p>")
-                    file.write(f"<p>Passed: {result['passed']}</p>")
-                    file.write(f"<p>Failed: {result['failed']}</p>")
-                    file.write(f"<p>Success Rate: {result['success_rate']}%</p>")
-            
-            # Add overall summary if available
-            if 'total_tests' in results:
-                file.write("<h2>Overall Summary</h2>")
-                file.write(f"<p>Total Tests: {results['total_tests']}</p>")
-                file.write(f"<p>Passed: {results['passed']}</p>")
-                file.write(f"<p>Failed: {results['failed']}</p>")
-                file.write(f"<p>Success Rate: {results['success_rate']:.1f}%</p>")
-                
-            file.write("</body></html>")
-        logger.info(f"HTML report saved to {report_path}")
+        html = _HTML_TEMPLATE.render(results=results, summary_fields=_SUMMARY_FIELDS)
+        self._write(report_path, html)
+        logger.info("HTML report saved to %s", report_path)
 
     def _generate_csv_report(self, results):
         logger.info("Generating CSV report...")
         report_path = os.path.join(self.output_dir, 'report.csv')
-        with open(report_path, 'w') as file:
-            file.write("test_type,total_tests,passed,failed,success_rate\n")
-            
-            # Skip summary fields for individual test sections
-            summary_fields = {'total_tests', 'passed', 'failed', 'success_rate'}
-            
-            for test_type, result in results.items():
-                if test_type not in summary_fields and isinstance(result, dict):
-                    file.write(f"{test_type},{result['total_tests']},{result['passed']},{result['failed']},{result['success_rate']}\n")
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerow(['test_type', 'total_tests', 'passed', 'failed', 'success_rate'])
+        
+        # Skip summary fields for individual test sections
+        for test_type, result in results.items():
+            if test_type not in _SUMMARY_FIELDS and isinstance(result, dict):
+                writer.writerow([test_type, result['total_tests'], result['passed'],
+                                 result['failed'], result['success_rate']])
+        
+        # Add overall summary if available
+        if 'total_tests' in results:
+            writer.writerow(['overall', results['total_tests'], results['passed'],
+                             results['failed'], f"{results['success_rate']:.1f}"])
             
-            # Add overall summary if available
-            if 'total_tests' in results:
-                file.write(f"overall,{results['total_tests']},{results['passed']},{results['failed']},{results['success_rate']:.1f}\n")
-                
-        logger.info(f"CSV report saved to {report_path}")
+        self._write(report_path, out.getvalue())
+        logger.info("CSV report saved to %s", report_path)
 
@@ -3,6 +3,13 @@ import logging
 logger = logging.getLogger(__name__)
 
 def setup_logging(level=logging.INFO):
+    root = logging.getLogger()
+    root.setLevel(level)
+    # Only attach a handler the first time; later calls just adjust the level
+    if root.handlers:
+        return
     format_str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    logging.basicConfig(level=level, format=format_str)
-    logging.info("Logging is set up.")
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(format_str))
+    root.addHandler(handler)
+    logger.info("Logging is set up.")
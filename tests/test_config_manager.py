@@ -0,0 +1,62 @@
+import glob
+import os
+
+from src.core import config_manager
+from src.core.config_manager import ConfigManager
+
+
+def _write_config(tmp_path, text):
+    path = tmp_path / 'config.yaml'
+    path.write_text(text)
+    return str(path)
+
+
+def _sidecars(path):
+    return glob.glob(f"{glob.escape(path)}.*.json")
+
+
+def _load(path):
+    # Bypass the in-memory cache so the sidecar layer is exercised
+    config_manager._CACHE.clear()
+    return ConfigManager(path).get_config()
+
+
+def test_sidecar_hit_returns_cached_config(tmp_path):
+    path = _write_config(tmp_path, "reporting:\n  output_dir: reports\n")
+    assert _load(path) == {'reporting': {'output_dir': 'reports'}}
+    (sidecar,) = _sidecars(path)
+
+    # Prove the second load reads the sidecar rather than the YAML
+    with open(sidecar, 'w') as file:
+        file.write('{"from": "sidecar"}')
+    assert _load(path) == {'from': 'sidecar'}
+
+
+def test_corrupt_sidecar_is_rebuilt(tmp_path):
+    path = _write_config(tmp_path, "iterations: 5\n")
+    _load(path)
+    (sidecar,) = _sidecars(path)
+    with open(sidecar, 'w') as file:
+        file.write('{corrupt')
+
+    assert _load(path) == {'iterations': 5}
+    with open(sidecar) as file:
+        assert file.read() == '{"iterations": 5}'
+
+
+def test_stale_purge_leaves_unrelated_siblings(tmp_path):
+    path = _write_config(tmp_path, "iterations: 5\n")
+    schema = f"{path}.schema.json"
+    with open(schema, 'w') as file:
+        file.write('{}')
+    _load(path)
+    (old_sidecar,) = [p for p in _sidecars(path) if p != schema]
+
+    # Change the contents (and size) so the in-memory and sidecar caches miss
+    with open(path, 'w') as file:
+        file.write("iterations: 10\n")
+    assert _load(path) == {'iterations': 10}
+
+    assert os.path.exists(schema)
+    assert not os.path.exists(old_sidecar)
+    assert len(_sidecars(path)) == 2
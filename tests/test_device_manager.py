@@ -0,0 +1,66 @@
+import copy
+import pickle
+
+from src.core import device_manager
+from src.core.device_manager import DeviceInfo, DeviceManager
+
+
+def _device():
+    return DeviceInfo(
+        path='/media/usb',
+        device='/dev/sdb1',
+        file_system='vfat',
+        label='usb',
+        size_bytes=2 * 1024**3,
+        free_bytes=1024**3,
+        used_bytes=1024**3,
+        is_removable=True
+    )
+
+
+def test_device_info_copy_round_trip():
+    device = _device()
+    assert copy.copy(device) == device
+    assert copy.deepcopy(device) == device
+
+
+def test_device_info_pickle_round_trip():
+    device = _device()
+    restored = pickle.loads(pickle.dumps(device))
+    assert restored == device
+    assert restored.size_gb == 2.0
+
+
+def test_strict_validation_probes_after_fast_path_pass(tmp_path, monkeypatch):
+    probes = []
+    monkeypatch.setattr(DeviceManager, '_probe_write',
+                        lambda self, path, strict: probes.append(strict))
+    manager = DeviceManager()
+
+    assert manager.validate_device(str(tmp_path))
+    assert manager.validate_device(str(tmp_path))
+    assert manager.validate_device(str(tmp_path), strict=True)
+    assert manager.validate_device(str(tmp_path), strict=True)
+    assert probes == [False, True]
+
+
+def test_volume_label_cache_expires(monkeypatch):
+    labels = iter(['OLD', 'NEW'])
+    now = [100.0]
+    monkeypatch.setattr(device_manager, '_LABEL_CACHE', {})
+    monkeypatch.setattr(device_manager, '_win32_volume_label', lambda path: next(labels))
+    monkeypatch.setattr(device_manager.time, 'monotonic', lambda: now[0])
+
+    assert device_manager._query_volume_label('E:\\') == 'OLD'
+    assert device_manager._query_volume_label('E:\\') == 'OLD'
+    now[0] += device_manager._PARTITION_CACHE_TTL + 1
+    assert device_manager._query_volume_label('E:\\') == 'NEW'
+
+
+def test_symlink_to_mount_point_is_not_mounted(tmp_path):
+    link = tmp_path / 'root_link'
+    link.symlink_to('/')
+    manager = DeviceManager()
+
+    assert manager.is_device_mounted('/')
+    assert not manager.is_device_mounted(str(link))
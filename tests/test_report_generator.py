@@ -0,0 +1,21 @@
+import shutil
+
+from src.reporting.report_generator import ReportGenerator
+
+RESULTS = {
+    'performance': {'total_tests': 1, 'passed': 1, 'failed': 0, 'success_rate': 100.0},
+    'total_tests': 1,
+    'passed': 1,
+    'failed': 0,
+    'success_rate': 100.0
+}
+
+
+def test_reports_recreate_removed_output_dir(tmp_path):
+    output_dir = tmp_path / 'reports'
+    generator = ReportGenerator({'reporting': {'output_dir': str(output_dir)}})
+    shutil.rmtree(output_dir)
+
+    generator.generate_reports(RESULTS)
+    assert (output_dir / 'report.html').exists()
+    assert (output_dir / 'report.csv').read_text().startswith('test_type,')